@@ -1,40 +1,170 @@
+import io
+import os
+import re
+import string
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; charts are only ever written to files
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 import numpy as np
 
-# Set style for better looking plots
-plt.style.use('seaborn')
-sns.set_palette("husl")
+# Plot style for better looking charts, applied while each chart renders
+PLOT_STYLE = 'seaborn-v0_8'
+PLOT_PALETTE = 'husl'
+
+DATA_FILE = 'Resumes_Submissions_Submitted.csv'
+
+# Bump whenever load_data() changes the columns or dtypes it produces, so caches
+# written by an older loader are ignored instead of being read back
+CACHE_VERSION = 3
+CACHE_FILE = f'.cache-v{CACHE_VERSION}.parquet'
+
+# Render the charts in worker processes. Off by default: the charts take about a second
+# in total, which is about what starting workers that re-import pandas/matplotlib costs
+PARALLEL_CHARTS = False
 
 def load_data():
-    """Load and preprocess the CSV data."""
-    df = pd.read_csv('Resumes_Submissions_Submitted.csv')
+    """Load and preprocess the CSV data, reusing the Parquet cache when it is up to date."""
+    # The cache stores already-parsed datetimes, so a fresh cache skips CSV and date parsing
+    csv_mtime = os.path.getmtime(DATA_FILE)
+    if os.path.exists(CACHE_FILE) and os.path.getmtime(CACHE_FILE) >= csv_mtime:
+        try:
+            return pd.read_parquet(CACHE_FILE, engine='pyarrow')
+        except (OSError, ValueError) as e:  # pyarrow's ArrowInvalid is a ValueError
+            print(f"Ignoring unreadable cache {CACHE_FILE}: {e}")
+    
+    # Read only the columns the reports use, with explicit dtypes so pandas skips
+    # inference. The low-cardinality flag columns are categories so comparisons run
+    # on integer codes, and dates are parsed while reading (each distinct date once).
+    # Quality is nullable because new rows may not have been rated yet.
+    df = pd.read_csv(
+        DATA_FILE,
+        usecols=['Date', 'Company', 'Title', 'Quality', 'Local/Remote', 'Closed', 'Interviews', 'Recruiter'],
+        dtype={
+            'Quality': 'Int8',
+            'Interviews': 'category',
+            'Recruiter': 'category',
+            'Local/Remote': 'category',
+            'Closed': 'category'
+        },
+        parse_dates=['Date'],
+        date_format='%m/%d/%Y'
+    )
+    
+    # Write to a temporary file next to the cache and rename it into place, so an
+    # interrupted run can never leave a half-written cache behind
+    cache_dir = os.path.dirname(os.path.abspath(CACHE_FILE))
+    fd, tmp_path = tempfile.mkstemp(prefix='.cache-', suffix='.tmp', dir=cache_dir)
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow')
+        os.replace(tmp_path, CACHE_FILE)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
     
-    # Convert date string to datetime
-    df['Date'] = pd.to_datetime(df['Date'], format='%m/%d/%Y')
+    return df
+
+def figure_to_svg(fig, label):
+    """Render a figure to an SVG string that can be inlined in the dashboard HTML."""
+    # Keep text as <text> elements rather than embedding a glyph definition per character
+    buf = io.StringIO()
+    with plt.rc_context({'svg.fonttype': 'none'}):
+        fig.savefig(buf, format='svg')
+    svg = buf.getvalue()
+    
+    # Every SVG numbers its ids the same way (figure_1, axes_1, ...), so prefix the ids
+    # and the references to them to keep them unique once the charts share one page
+    prefix = re.sub(r'\W+', '-', label.lower())
+    svg = re.sub(r'(\bid="|url\(#|href="#)', rf'\g<1>{prefix}-', svg)
+    
+    # Drop the XML prolog and doctype; inline SVG starts at the <svg> tag. The label
+    # stands in for the alt text the chart images used to carry.
+    svg = svg[svg.index('<svg'):]
+    return svg.replace('<svg', f'<svg role="img" aria-label="{label}"', 1)
+
+def lttb_indices(x, y, n_out):
+    """Pick n_out point indices that preserve a line's shape (Largest-Triangle-Three-Buckets)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    
+    # Always keep the endpoints; split the interior into n_out - 2 buckets
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        
+        # Average of the next bucket (the last point for the final bucket)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and that average
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    
+    return indices
+
+def add_derived_columns(df):
+    """Add the helper columns used by the vectorized aggregations."""
+    # Boolean interview flag so rates can be taken with a plain groupby mean
+    df['_iv'] = df['Interviews'].values == 'Y'
+    
+    # Month bucket plus the flags the monthly charts sum over
+    df['_month'] = df['Date'].dt.to_period('M')
+    # Unrated applications have a missing Quality, which counts as neither 1 nor 2
+    df['_q1'] = df['_iv'] & df['Quality'].eq(1).fillna(False).to_numpy(dtype=bool)
+    df['_q2'] = df['_iv'] & df['Quality'].eq(2).fillna(False).to_numpy(dtype=bool)
+    df['_closed'] = df['Closed'].values == 'Y'
     
     return df
 
-def plot_high_quality_interview_table(df):
+def active_months(series):
+    """Trim leading and trailing zero months from a monthly count series."""
+    nonzero = series.index[series.values > 0]
+    if len(nonzero) == 0:
+        return series.iloc[:0]
+    return series.loc[nonzero[0]:nonzero[-1]]
+
+def plot_high_quality_interview_table(df, metrics, fig):
     """Create a table visualization of high-quality jobs (Quality 1-2) that resulted in interviews."""
     # Filter for high quality interviews
     mask = (df['Quality'].isin([1, 2])) & (df['Interviews'] == 'Y')
-    high_quality_interviews = df[mask].copy()
     
-    # Sort by date
-    high_quality_interviews = high_quality_interviews.sort_values('Date')
+    # Sort by date (sort_values returns a new frame, so no defensive copy is needed)
+    high_quality_interviews = df[mask].sort_values('Date')
     
     # Format date for display
-    high_quality_interviews['Date'] = high_quality_interviews['Date'].dt.strftime('%m/%d/%Y')
+    high_quality_interviews = high_quality_interviews.assign(
+        Date=high_quality_interviews['Date'].dt.strftime('%m/%d/%Y')
+    )
     
     # Select and rename columns for display
     display_cols = ['Date', 'Company', 'Title', 'Quality', 'Local/Remote', 'Closed']
     table_data = high_quality_interviews[display_cols].values
     
-    # Create figure and axis
-    fig, ax = plt.subplots(figsize=(15, len(table_data) * 0.5 + 1))  # Adjust height based on number of rows
+    # Reset the shared figure and add an axis
+    fig.clear()
+    fig.set_size_inches(15, len(table_data) * 0.5 + 1)  # Adjust height based on number of rows
+    ax = fig.add_subplot()
     
     # Remove axis
     ax.axis('off')
@@ -52,75 +182,138 @@ def plot_high_quality_interview_table(df):
     table.auto_set_font_size(False)
     table.set_fontsize(9)
     
-    # Color the header row
-    for i in range(len(display_cols)):
-        table[(0, i)].set_facecolor('#E6E6E6')
-        table[(0, i)].set_text_props(weight='bold')
+    # Row colors based on Quality: light green for Q1, light yellow for Q2
+    row_colors = np.where(table_data[:, 3] == 1, '#E8F5E9', '#FFF9C4')
     
-    # Color rows based on Quality
-    for i in range(len(table_data)):
-        quality = table_data[i][3]  # Quality column
-        row_color = '#E8F5E9' if quality == 1 else '#FFF9C4'  # Light green for Q1, light yellow for Q2
-        for j in range(len(display_cols)):
-            table[(i + 1, j)].set_facecolor(row_color)
+    # Color the header row and the data rows in one walk over the cells
+    for (row, col), cell in table.get_celld().items():
+        if row == 0:
+            cell.set_facecolor('#E6E6E6')
+            cell.set_text_props(weight='bold')
+        else:
+            cell.set_facecolor(row_colors[row - 1])
     
     # Adjust cell heights
     table.scale(1, 1.5)
     
-    plt.title('High Quality Jobs with Interviews', pad=20)
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig('high_quality_interview_table.png', bbox_inches='tight', dpi=300)
-    plt.close()
+    ax.set_title('High Quality Jobs with Interviews', pad=20)
+    
+    # Render the figure for the dashboard
+    return figure_to_svg(fig, 'High Quality Interview Table')
+
+def compute_headline_metrics(df):
+    """Compute the headline counts and the interview rate by quality."""
+    # Count each categorical column in a single pass
+    iv = df['Interviews'].value_counts()
+    rc = df['Recruiter'].value_counts()
+    lr = df['Local/Remote'].value_counts()
+    
+    return {
+        'total_apps': len(df),
+        'unique_companies': df['Company'].nunique(),
+        'interviews': iv.get('Y', 0),
+        'recruiters': rc.get('Y', 0),
+        'remote_positions': lr.get('Remote', 0),
+        'local_positions': lr.get('Local', 0),
+        'avg_quality': df['Quality'].mean(),
+        'interview_rate_by_quality': df.groupby('Quality')['_iv'].mean() * 100,
+    }
 
-def generate_basic_metrics(df):
+def compute_all_metrics(df):
+    """Compute the aggregates shared by the reports and the dashboard in one place."""
+    metrics = compute_headline_metrics(df)
+    
+    # Position status counts and the interview rate for each status
+    status_counts = df['Closed'].value_counts()
+    interview_rate_by_status = df.groupby('Closed', observed=True)['_iv'].mean() * 100
+    
+    # Share of applications with/without a recruiter that led to an interview
+    recruiter_crosstab = pd.crosstab(df['Recruiter'], df['Interviews'], normalize='index')
+    recruiter_rates = recruiter_crosstab.reindex(columns=['Y'], fill_value=0)['Y'] * 100
+    
+    # Closed and total positions per quality in one grouping pass
+    closure_by_quality = df.groupby('Quality')['_closed'].agg(closed='sum', total='size')
+    closure_by_quality['rate'] = closure_by_quality['closed'] / closure_by_quality['total'] * 100
+    
+    # Monthly counts for every chart in one grouping pass, with empty months filled in
+    monthly = df.groupby('_month').agg(
+        apps=('Date', 'size'),
+        interviews=('_iv', 'sum'),
+        q1=('_q1', 'sum'),
+        q2=('_q2', 'sum'),
+        closed=('_closed', 'sum')
+    )
+    monthly = monthly.reindex(
+        pd.period_range(monthly.index.min(), monthly.index.max(), freq='M'), fill_value=0
+    )
+    
+    metrics.update({
+        'status_counts': status_counts,
+        'closed_positions': status_counts.get('Y', 0),
+        'open_positions': status_counts.get('N', 0),
+        'unknown_positions': status_counts.get('I', 0),
+        'interview_rate_by_status': interview_rate_by_status,
+        'recruiter_interview_rate': recruiter_rates.get('Y', 0),
+        'no_recruiter_interview_rate': recruiter_rates.get('N', 0),
+        'closure_by_quality': closure_by_quality,
+        'monthly': monthly,
+    })
+    
+    return metrics
+
+def generate_basic_metrics(df, metrics):
     """Generate basic metrics about the job search."""
-    metrics = {
-        'Total Applications': len(df),
-        'Unique Companies': df['Company'].nunique(),
-        'Applications with Interviews': len(df[df['Interviews'] == 'Y']),
-        'Applications with Recruiters': len(df[df['Recruiter'] == 'Y']),
-        'Remote Positions': len(df[df['Local/Remote'] == 'Remote']),
-        'Local Positions': len(df[df['Local/Remote'] == 'Local']),
-        'Closed Positions': len(df[df['Closed'] == 'Y']),
-        'Open Positions': len(df[df['Closed'] == 'N']),
-        'Unknown Status Positions': len(df[df['Closed'] == 'I']),
-        'Average Quality Score': df['Quality'].mean()
+    summary = {
+        'Total Applications': metrics['total_apps'],
+        'Unique Companies': metrics['unique_companies'],
+        'Applications with Interviews': metrics['interviews'],
+        'Applications with Recruiters': metrics['recruiters'],
+        'Remote Positions': metrics['remote_positions'],
+        'Local Positions': metrics['local_positions'],
+        'Closed Positions': metrics['closed_positions'],
+        'Open Positions': metrics['open_positions'],
+        'Unknown Status Positions': metrics['unknown_positions'],
+        'Average Quality Score': metrics['avg_quality']
     }
     
     print("\n=== Basic Metrics ===")
-    for metric, value in metrics.items():
+    for metric, value in summary.items():
         if isinstance(value, float):
             print(f"{metric}: {value:.2f}")
         else:
             print(f"{metric}: {value}")
 
-def plot_applications_over_time(df):
+def plot_applications_over_time(df, metrics, fig):
     """Create a plot showing applications over time."""
-    plt.figure(figsize=(12, 6))
+    fig.clear()
+    fig.set_size_inches(12, 6)
+    ax = fig.add_subplot()
+    
+    # Applications per month
+    monthly_apps = metrics['monthly']['apps']
+    dates = monthly_apps.index.to_timestamp()
+    
+    # Never draw more points than the chart is pixels wide; long series are
+    # downsampled with LTTB so peaks and dips survive
+    n_pixels = int(fig.get_figwidth() * fig.dpi)
+    keep = lttb_indices(dates.asi8, monthly_apps.values, n_pixels)
     
-    # Create applications per month
-    monthly_apps = df.resample('M', on='Date').size()
+    ax.plot(dates[keep], monthly_apps.values[keep], marker='o')
+    ax.set_title('Applications Submitted Over Time')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Number of Applications')
+    ax.tick_params(axis='x', labelrotation=45)
     
-    plt.plot(monthly_apps.index, monthly_apps.values, marker='o')
-    plt.title('Applications Submitted Over Time')
-    plt.xlabel('Date')
-    plt.ylabel('Number of Applications')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('applications_over_time.png')
-    plt.close()
+    return figure_to_svg(fig, 'Applications Over Time Chart')
 
-def plot_interviews_per_month(df):
+def plot_interviews_per_month(df, metrics, fig):
     """Create a plot showing interviews per month."""
-    plt.figure(figsize=(12, 6))
-    
-    # Create a mask for interviews
-    interviews_mask = df['Interviews'] == 'Y'
+    fig.clear()
+    fig.set_size_inches(12, 6)
+    ax = fig.add_subplot()
     
     # Get interviews per month
-    monthly_interviews = df[interviews_mask].resample('M', on='Date').size()
+    monthly_interviews = active_months(metrics['monthly']['interviews'])
     
     # Create x-axis labels with month names
     month_labels = monthly_interviews.index.strftime('%B %Y')
@@ -129,132 +322,93 @@ def plot_interviews_per_month(df):
     x_positions = range(len(monthly_interviews))
     
     # Plot the data
-    plt.bar(x_positions, monthly_interviews.values, color='green', alpha=0.7)
-    plt.title('Interviews Per Month')
-    plt.xlabel('Month')
-    plt.ylabel('Number of Interviews')
+    bars = ax.bar(x_positions, monthly_interviews.values, color='green', alpha=0.7)
+    ax.set_title('Interviews Per Month')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Number of Interviews')
     
     # Set x-axis ticks and labels
-    plt.xticks(x_positions, month_labels, rotation=45, ha='right')
+    ax.set_xticks(x_positions, month_labels, rotation=45, ha='right')
     
-    # Add value labels on top of each bar
-    for i, v in enumerate(monthly_interviews.values):
-        if v > 0:  # Only add label if there were interviews
-            plt.text(i, v, str(int(v)), 
-                    ha='center', va='bottom')
+    # Add value labels on top of each bar, skipping months without interviews
+    ax.bar_label(bars, labels=[str(int(v)) if v > 0 else '' for v in monthly_interviews.values], padding=3)
     
-    # Adjust layout to prevent label cutoff
-    plt.subplots_adjust(bottom=0.2)
-    plt.tight_layout()
-    plt.savefig('interviews_per_month.png')
-    plt.close()
+    return figure_to_svg(fig, 'Interviews Per Month Chart')
 
-def plot_high_quality_interviews_per_month(df):
+def plot_high_quality_interviews_per_month(df, metrics, fig):
     """Create a plot showing interviews per month for positions with Quality 1 or 2."""
-    plt.figure(figsize=(12, 6))
-    
-    # Filter for interviews only
-    interviews_df = df[df['Interviews'] == 'Y'].copy()
+    fig.clear()
+    fig.set_size_inches(12, 6)
+    ax = fig.add_subplot()
     
-    # Create separate dataframes for Quality 1 and 2
-    q1_interviews = interviews_df[interviews_df['Quality'] == 1]
-    q2_interviews = interviews_df[interviews_df['Quality'] == 2]
-    
-    # Get monthly counts for each quality
-    monthly_q1 = q1_interviews.resample('M', on='Date').size()
-    monthly_q2 = q2_interviews.resample('M', on='Date').size()
-    
-    # Ensure both series have the same index
-    all_months = sorted(list(set(monthly_q1.index) | set(monthly_q2.index)))
-    monthly_q1 = monthly_q1.reindex(all_months, fill_value=0)
-    monthly_q2 = monthly_q2.reindex(all_months, fill_value=0)
+    # Get monthly counts for each quality over the months with any high quality interview
+    monthly = metrics['monthly']
+    all_months = active_months(monthly['q1'] + monthly['q2']).index
+    monthly_q1 = monthly['q1'].reindex(all_months)
+    monthly_q2 = monthly['q2'].reindex(all_months)
     
     # Create x-axis labels and positions
-    month_labels = [d.strftime('%B %Y') for d in all_months]
+    month_labels = all_months.strftime('%B %Y')
     x_positions = range(len(all_months))
     
     # Create the stacked bar chart - Quality 2 at bottom, Quality 1 on top
-    plt.bar(x_positions, monthly_q2.values, color='yellow', alpha=0.7, label='Quality 2')
-    plt.bar(x_positions, monthly_q1.values, bottom=monthly_q2.values, color='green', alpha=0.7, label='Quality 1')
+    bars_q2 = ax.bar(x_positions, monthly_q2.values, color='yellow', alpha=0.7, label='Quality 2')
+    bars_q1 = ax.bar(x_positions, monthly_q1.values, bottom=monthly_q2.values, color='green', alpha=0.7, label='Quality 1')
     
-    plt.title('High Quality Interviews Per Month')
-    plt.xlabel('Month')
-    plt.ylabel('Number of Interviews')
-    plt.legend()
+    ax.set_title('High Quality Interviews Per Month')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Number of Interviews')
+    ax.legend()
     
     # Set x-axis ticks and labels
-    plt.xticks(x_positions, month_labels, rotation=45, ha='right')
+    ax.set_xticks(x_positions, month_labels, rotation=45, ha='right')
     
-    # Add value labels on top of bars
-    for i in range(len(all_months)):
-        q1_val = monthly_q1.values[i]
-        q2_val = monthly_q2.values[i]
-        total = q1_val + q2_val
-        
-        if total > 0:
-            # If there's a mix of qualities, show both numbers
-            if q1_val > 0 and q2_val > 0:
-                plt.text(i, total, f'Q1:{int(q1_val)}\nQ2:{int(q2_val)}', 
-                        ha='center', va='bottom')
-            # If it's only Quality 1
-            elif q1_val > 0:
-                plt.text(i, q1_val, str(int(q1_val)), 
-                        ha='center', va='bottom')
-            # If it's only Quality 2
-            elif q2_val > 0:
-                plt.text(i, q2_val, str(int(q2_val)), 
-                        ha='center', va='bottom')
-    
-    # Adjust layout to prevent label cutoff
-    plt.subplots_adjust(bottom=0.2)
-    plt.tight_layout()
-    plt.savefig('high_quality_interviews_per_month.png')
-    plt.close()
-
-def plot_quality_distribution(df):
+    # Add value labels on top of the stacked bars: both counts for a mix of
+    # qualities, otherwise just the single count
+    labels = [
+        f'Q1:{int(q1)}\nQ2:{int(q2)}' if q1 and q2 else (str(int(q1)) if q1 else (str(int(q2)) if q2 else ''))
+        for q1, q2 in zip(monthly_q1.values, monthly_q2.values)
+    ]
+    ax.bar_label(bars_q1, labels=labels, padding=3)
+    
+    return figure_to_svg(fig, 'High Quality Interviews Per Month Chart')
+
+def plot_quality_distribution(df, metrics, fig):
     """Create a plot showing the distribution of job quality ratings."""
-    plt.figure(figsize=(10, 6))
+    fig.clear()
+    fig.set_size_inches(10, 6)
+    ax = fig.add_subplot()
     
-    sns.countplot(data=df, x='Quality')
-    plt.title('Distribution of Job Quality Ratings')
-    plt.xlabel('Quality Rating')
-    plt.ylabel('Number of Applications')
-    plt.tight_layout()
-    plt.savefig('quality_distribution.png')
-    plt.close()
+    # Seaborn cannot handle the missing values of the nullable Quality column, so count rated rows only
+    sns.countplot(x=df['Quality'].dropna().astype('int8'), ax=ax)
+    ax.set_title('Distribution of Job Quality Ratings')
+    ax.set_xlabel('Quality Rating')
+    ax.set_ylabel('Number of Applications')
+    
+    return figure_to_svg(fig, 'Quality Distribution Chart')
 
-def analyze_interview_success(df):
+def analyze_interview_success(df, metrics):
     """Analyze factors related to interview success."""
     print("\n=== Interview Success Analysis ===")
     
     # Interview rate by quality
-    interview_rate_by_quality = df.groupby('Quality')['Interviews'].apply(
-        lambda x: (x == 'Y').mean() * 100
-    )
     print("\nInterview Rate by Quality Rating:")
-    for quality, rate in interview_rate_by_quality.items():
+    for quality, rate in metrics['interview_rate_by_quality'].items():
         print(f"Quality {quality}: {rate:.1f}%")
     
     # Interview rate with/without recruiter
-    recruiter_interview_rate = df[df['Recruiter'] == 'Y']['Interviews'].apply(
-        lambda x: x == 'Y'
-    ).mean() * 100
-    no_recruiter_interview_rate = df[df['Recruiter'] == 'N']['Interviews'].apply(
-        lambda x: x == 'Y'
-    ).mean() * 100
-    
-    print(f"\nInterview Rate with Recruiter: {recruiter_interview_rate:.1f}%")
-    print(f"Interview Rate without Recruiter: {no_recruiter_interview_rate:.1f}%")
+    print(f"\nInterview Rate with Recruiter: {metrics['recruiter_interview_rate']:.1f}%")
+    print(f"Interview Rate without Recruiter: {metrics['no_recruiter_interview_rate']:.1f}%")
 
-def plot_closed_positions_distribution(df):
+def plot_closed_positions_distribution(df, metrics, fig):
     """Create a visualization showing the distribution of position closure status."""
-    plt.figure(figsize=(12, 8))
-    
-    # Create two subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    # Reset the shared figure and create two subplots
+    fig.clear()
+    fig.set_size_inches(15, 6)
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Pie chart of position status
-    status_counts = df['Closed'].value_counts()
+    status_counts = metrics['status_counts']
     status_labels = {
         'Y': 'Closed',
         'N': 'Open', 
@@ -269,17 +423,8 @@ def plot_closed_positions_distribution(df):
     ax1.set_title('Position Status Distribution')
     
     # Bar chart of closure rate by quality
-    quality_closure = []
-    quality_labels = []
-    
-    for quality in sorted(df['Quality'].unique()):
-        quality_df = df[df['Quality'] == quality]
-        closed_count = len(quality_df[quality_df['Closed'] == 'Y'])
-        total_count = len(quality_df)
-        if total_count > 0:
-            closure_rate = closed_count / total_count * 100
-            quality_closure.append(closure_rate)
-            quality_labels.append(f'Quality {quality}')
+    quality_closure = metrics['closure_by_quality']['rate'].tolist()
+    quality_labels = [f'Quality {quality}' for quality in metrics['closure_by_quality'].index]
     
     bars = ax2.bar(quality_labels, quality_closure, color=['#4ECDC4', '#FFE66D', '#FF6B6B'])
     ax2.set_title('Position Closure Rate by Quality')
@@ -292,19 +437,17 @@ def plot_closed_positions_distribution(df):
         ax2.text(bar.get_x() + bar.get_width()/2., height,
                 f'{rate:.1f}%', ha='center', va='bottom')
     
-    plt.tight_layout()
-    plt.savefig('closed_positions_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    return figure_to_svg(fig, 'Closed Positions Distribution Chart')
 
-def analyze_closed_positions(df):
+def analyze_closed_positions(df, metrics):
     """Analyze patterns in closed vs open positions."""
     print("\n=== Position Closure Analysis ===")
     
     # Overall closure rates
-    total_positions = len(df)
-    closed_positions = len(df[df['Closed'] == 'Y'])
-    open_positions = len(df[df['Closed'] == 'N'])
-    unknown_positions = len(df[df['Closed'] == 'I'])
+    total_positions = metrics['total_apps']
+    closed_positions = metrics['closed_positions']
+    open_positions = metrics['open_positions']
+    unknown_positions = metrics['unknown_positions']
     
     print(f"\nPosition Status Distribution:")
     print(f"Closed: {closed_positions} ({closed_positions/total_positions*100:.1f}%)")
@@ -313,104 +456,53 @@ def analyze_closed_positions(df):
     
     # Closure rate by quality
     print(f"\nClosure Rate by Quality:")
-    for quality in sorted(df['Quality'].unique()):
-        quality_df = df[df['Quality'] == quality]
-        quality_closed = len(quality_df[quality_df['Closed'] == 'Y'])
-        quality_total = len(quality_df)
-        if quality_total > 0:
-            closure_rate = quality_closed / quality_total * 100
-            print(f"Quality {quality}: {quality_closed}/{quality_total} ({closure_rate:.1f}%)")
+    for quality, closed, total, rate in metrics['closure_by_quality'].itertuples():
+        print(f"Quality {quality}: {closed}/{total} ({rate:.1f}%)")
     
     # Interview success for closed vs open positions
-    closed_df = df[df['Closed'] == 'Y']
-    open_df = df[df['Closed'] == 'N']
+    if closed_positions > 0:
+        print(f"\nInterview Rate for Closed Positions: {metrics['interview_rate_by_status']['Y']:.1f}%")
     
-    if len(closed_df) > 0:
-        closed_interview_rate = len(closed_df[closed_df['Interviews'] == 'Y']) / len(closed_df) * 100
-        print(f"\nInterview Rate for Closed Positions: {closed_interview_rate:.1f}%")
-    
-    if len(open_df) > 0:
-        open_interview_rate = len(open_df[open_df['Interviews'] == 'Y']) / len(open_df) * 100
-        print(f"Interview Rate for Open Positions: {open_interview_rate:.1f}%")
+    if open_positions > 0:
+        print(f"Interview Rate for Open Positions: {metrics['interview_rate_by_status']['N']:.1f}%")
     
     # Time analysis - when were positions closed?
-    if len(closed_df) > 0:
+    if closed_positions > 0:
         print(f"\nClosed Position Timeline:")
-        closed_by_month = closed_df.resample('M', on='Date').size()
+        closed_by_month = metrics['monthly']['closed']
         for date, count in closed_by_month.items():
             if count > 0:
                 print(f"{date.strftime('%B %Y')}: {count} positions closed")
 
-def generate_html_dashboard(df):
-    """Generate an HTML dashboard with current metrics and charts."""
-    # Calculate current metrics
-    total_apps = len(df)
-    unique_companies = df['Company'].nunique()
-    interviews = len(df[df['Interviews'] == 'Y'])
-    interview_rate = (interviews / total_apps * 100) if total_apps > 0 else 0
-    recruiters = len(df[df['Recruiter'] == 'Y'])
-    avg_quality = df['Quality'].mean()
-    
-    closed_positions = len(df[df['Closed'] == 'Y'])
-    open_positions = len(df[df['Closed'] == 'N'])
-    unknown_positions = len(df[df['Closed'] == 'I'])
-    
-    closed_pct = (closed_positions / total_apps * 100) if total_apps > 0 else 0
-    open_pct = (open_positions / total_apps * 100) if total_apps > 0 else 0
-    unknown_pct = (unknown_positions / total_apps * 100) if total_apps > 0 else 0
-    
-    # Calculate interview rates by quality
-    interview_rates_by_quality = {}
-    for quality in sorted(df['Quality'].unique()):
-        quality_df = df[df['Quality'] == quality]
-        quality_interviews = len(quality_df[quality_df['Interviews'] == 'Y'])
-        quality_total = len(quality_df)
-        if quality_total > 0:
-            rate = quality_interviews / quality_total * 100
-            interview_rates_by_quality[quality] = rate
-    
-    # Calculate recruiter impact
-    recruiter_interview_rate = 0
-    no_recruiter_interview_rate = 0
-    
-    recruiter_df = df[df['Recruiter'] == 'Y']
-    no_recruiter_df = df[df['Recruiter'] == 'N']
-    
-    if len(recruiter_df) > 0:
-        recruiter_interview_rate = len(recruiter_df[recruiter_df['Interviews'] == 'Y']) / len(recruiter_df) * 100
-    
-    if len(no_recruiter_df) > 0:
-        no_recruiter_interview_rate = len(no_recruiter_df[no_recruiter_df['Interviews'] == 'Y']) / len(no_recruiter_df) * 100
-    
-    # Generate the HTML content
-    html_content = f'''<!DOCTYPE html>
+# Dashboard page, parsed once at import; generate_html_dashboard() fills in the $placeholders
+DASHBOARD_TEMPLATE = string.Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Job Search Metrics Dashboard</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
 
-        .header {{
+        .header {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             padding: 2rem;
@@ -418,28 +510,28 @@ def generate_html_dashboard(df):
             margin-bottom: 2rem;
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             text-align: center;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             color: #2c3e50;
             font-size: 2.5rem;
             margin-bottom: 0.5rem;
             font-weight: 300;
-        }}
+        }
 
-        .header p {{
+        .header p {
             color: #7f8c8d;
             font-size: 1.1rem;
-        }}
+        }
 
-        .metrics-grid {{
+        .metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1rem;
             margin-bottom: 2rem;
-        }}
+        }
 
-        .metric-card {{
+        .metric-card {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             padding: 1.5rem;
@@ -447,80 +539,80 @@ def generate_html_dashboard(df):
             box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
             text-align: center;
             transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
+        }
 
-        .metric-card:hover {{
+        .metric-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-        }}
+        }
 
-        .metric-value {{
+        .metric-value {
             font-size: 2rem;
             font-weight: bold;
             color: #3498db;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .metric-label {{
+        .metric-label {
             color: #7f8c8d;
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
 
-        .charts-section {{
+        .charts-section {
             margin-bottom: 2rem;
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             padding: 1rem 2rem;
             border-radius: 12px;
             margin-bottom: 1rem;
             box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        .section-title h2 {{
+        .section-title h2 {
             color: #2c3e50;
             font-size: 1.5rem;
             font-weight: 400;
-        }}
+        }
 
-        .chart-grid {{
+        .chart-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
             gap: 2rem;
-        }}
+        }
 
-        .chart-container {{
+        .chart-container {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             padding: 1.5rem;
             border-radius: 15px;
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             transition: transform 0.3s ease;
-        }}
+        }
 
-        .chart-container:hover {{
+        .chart-container:hover {
             transform: translateY(-3px);
-        }}
+        }
 
-        .chart-container h3 {{
+        .chart-container h3 {
             color: #2c3e50;
             margin-bottom: 1rem;
             font-size: 1.2rem;
             font-weight: 500;
-        }}
+        }
 
-        .chart-container img {{
+        .chart-container svg {
             width: 100%;
             height: auto;
             border-radius: 8px;
             box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        .table-container {{
+        .table-container {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             padding: 1.5rem;
@@ -528,51 +620,56 @@ def generate_html_dashboard(df):
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             margin-bottom: 2rem;
             overflow-x: auto;
-        }}
+        }
 
-        .table-container h3 {{
+        .table-container svg {
+            width: 100%;
+            height: auto;
+        }
+
+        .table-container h3 {
             color: #2c3e50;
             margin-bottom: 1rem;
             font-size: 1.2rem;
             font-weight: 500;
-        }}
+        }
 
-        .analysis-section {{
+        .analysis-section {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             padding: 2rem;
             border-radius: 15px;
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             margin-bottom: 2rem;
-        }}
+        }
 
-        .analysis-section h3 {{
+        .analysis-section h3 {
             color: #2c3e50;
             margin-bottom: 1rem;
             font-size: 1.3rem;
             font-weight: 500;
-        }}
+        }
 
-        .insight-item {{
+        .insight-item {
             background: #f8f9fa;
             padding: 1rem;
             border-left: 4px solid #3498db;
             margin-bottom: 1rem;
             border-radius: 0 8px 8px 0;
-        }}
+        }
 
-        .insight-item h4 {{
+        .insight-item h4 {
             color: #2c3e50;
             margin-bottom: 0.5rem;
             font-size: 1rem;
-        }}
+        }
 
-        .insight-item p {{
+        .insight-item p {
             color: #555;
             line-height: 1.5;
-        }}
+        }
 
-        .footer {{
+        .footer {
             background: rgba(255, 255, 255, 0.95);
             backdrop-filter: blur(10px);
             padding: 2rem;
@@ -580,46 +677,46 @@ def generate_html_dashboard(df):
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             text-align: center;
             margin-top: 2rem;
-        }}
+        }
 
-        .footer p {{
+        .footer p {
             color: #7f8c8d;
             font-size: 0.9rem;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 padding: 10px;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 2rem;
-            }}
+            }
             
-            .chart-grid {{
+            .chart-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .chart-container {{
+            .chart-container {
                 min-width: auto;
-            }}
+            }
             
-            .metrics-grid {{
+            .metrics-grid {
                 grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            }}
-        }}
+            }
+        }
 
-        .status-indicator {{
+        .status-indicator {
             display: inline-block;
             width: 12px;
             height: 12px;
             border-radius: 50%;
             margin-right: 8px;
-        }}
+        }
 
-        .status-closed {{ background-color: #e74c3c; }}
-        .status-open {{ background-color: #27ae60; }}
-        .status-unknown {{ background-color: #f39c12; }}
+        .status-closed { background-color: #e74c3c; }
+        .status-open { background-color: #27ae60; }
+        .status-unknown { background-color: #f39c12; }
     </style>
 </head>
 <body>
@@ -633,27 +730,27 @@ def generate_html_dashboard(df):
         <!-- Key Metrics Grid -->
         <div class="metrics-grid">
             <div class="metric-card">
-                <div class="metric-value">{total_apps}</div>
+                <div class="metric-value">$total_apps</div>
                 <div class="metric-label">Total Applications</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{unique_companies}</div>
+                <div class="metric-value">$unique_companies</div>
                 <div class="metric-label">Unique Companies</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{interviews}</div>
+                <div class="metric-value">$interviews</div>
                 <div class="metric-label">Interviews Secured</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{interview_rate:.1f}%</div>
+                <div class="metric-value">$interview_rate%</div>
                 <div class="metric-label">Interview Rate</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{recruiters}</div>
+                <div class="metric-value">$recruiters</div>
                 <div class="metric-label">Recruiter Contacts</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{avg_quality:.2f}</div>
+                <div class="metric-value">$avg_quality</div>
                 <div class="metric-label">Avg Quality Score</div>
             </div>
         </div>
@@ -664,21 +761,21 @@ def generate_html_dashboard(df):
         </div>
         <div class="metrics-grid">
             <div class="metric-card">
-                <div class="metric-value" style="color: #e74c3c;">{closed_positions}</div>
+                <div class="metric-value" style="color: #e74c3c;">$closed_positions</div>
                 <div class="metric-label">
-                    <span class="status-indicator status-closed"></span>Closed Positions ({closed_pct:.1f}%)
+                    <span class="status-indicator status-closed"></span>Closed Positions ($closed_pct%)
                 </div>
             </div>
             <div class="metric-card">
-                <div class="metric-value" style="color: #27ae60;">{open_positions}</div>
+                <div class="metric-value" style="color: #27ae60;">$open_positions</div>
                 <div class="metric-label">
-                    <span class="status-indicator status-open"></span>Open Positions ({open_pct:.1f}%)
+                    <span class="status-indicator status-open"></span>Open Positions ($open_pct%)
                 </div>
             </div>
             <div class="metric-card">
-                <div class="metric-value" style="color: #f39c12;">{unknown_positions}</div>
+                <div class="metric-value" style="color: #f39c12;">$unknown_positions</div>
                 <div class="metric-label">
-                    <span class="status-indicator status-unknown"></span>Unknown Status ({unknown_pct:.1f}%)
+                    <span class="status-indicator status-unknown"></span>Unknown Status ($unknown_pct%)
                 </div>
             </div>
         </div>
@@ -692,27 +789,27 @@ def generate_html_dashboard(df):
             <div class="chart-grid">
                 <div class="chart-container">
                     <h3>Applications Over Time</h3>
-                    <img src="applications_over_time.png" alt="Applications Over Time Chart">
+                    $applications_over_time
                 </div>
                 
                 <div class="chart-container">
                     <h3>Quality Distribution</h3>
-                    <img src="quality_distribution.png" alt="Quality Distribution Chart">
+                    $quality_distribution
                 </div>
                 
                 <div class="chart-container">
                     <h3>Interviews Per Month</h3>
-                    <img src="interviews_per_month.png" alt="Interviews Per Month Chart">
+                    $interviews_per_month
                 </div>
                 
                 <div class="chart-container">
                     <h3>High Quality Interviews Per Month</h3>
-                    <img src="high_quality_interviews_per_month.png" alt="High Quality Interviews Per Month Chart">
+                    $high_quality_interviews_per_month
                 </div>
                 
                 <div class="chart-container">
                     <h3>Position Status Distribution</h3>
-                    <img src="closed_positions_distribution.png" alt="Closed Positions Distribution Chart">
+                    $closed_positions_distribution
                 </div>
             </div>
         </div>
@@ -720,40 +817,14 @@ def generate_html_dashboard(df):
         <!-- High Quality Interview Table -->
         <div class="table-container">
             <h3>High Quality Positions with Interviews</h3>
-            <img src="high_quality_interview_table.png" alt="High Quality Interview Table" style="width: 100%; height: auto;">
+            $high_quality_interview_table
         </div>
 
         <!-- Key Insights Section -->
         <div class="analysis-section">
             <h3>Key Insights & Analysis</h3>
             
-            <div class="insight-item">
-                <h4>Interview Success by Quality</h4>
-                <p>'''
-    
-    # Add quality-specific interview rates
-    quality_text = " | ".join([f"<strong>Quality {q}:</strong> {r:.1f}% interview rate" for q, r in interview_rates_by_quality.items()])
-    html_content += quality_text + "</p>\n            </div>\n            \n"
-    
-    html_content += f'''            <div class="insight-item">
-                <h4>Recruiter Impact</h4>
-                <p>Applications with recruiter involvement have a <strong>{recruiter_interview_rate:.1f}%</strong> interview rate compared to <strong>{no_recruiter_interview_rate:.1f}%</strong> without recruiters, highlighting the critical importance of networking and recruiter relationships.</p>
-            </div>
-            
-            <div class="insight-item">
-                <h4>Position Closure Patterns</h4>
-                <p>Position closure analysis shows {closed_positions} confirmed closed positions ({closed_pct:.1f}%) out of {total_apps} total applications. Most positions ({unknown_pct:.1f}%) still have unknown status, indicating potential for future developments.</p>
-            </div>
-            
-            <div class="insight-item">
-                <h4>Geographic Distribution</h4>
-                <p><strong>Remote positions:</strong> {len(df[df['Local/Remote'] == 'Remote'])} applications | <strong>Local positions:</strong> {len(df[df['Local/Remote'] == 'Local'])} applications. Strategic focus on location preferences can optimize application success.</p>
-            </div>
-            
-            <div class="insight-item">
-                <h4>Market Activity</h4>
-                <p>With <strong>{unknown_pct:.1f}%</strong> of positions still having unknown status, there's significant potential for future developments. The data shows consistent application activity with strategic focus on higher-quality opportunities.</p>
-            </div>
+$insights_html
         </div>
 
         <!-- Footer -->
@@ -767,29 +838,76 @@ def generate_html_dashboard(df):
         document.getElementById('lastUpdated').textContent = new Date().toLocaleDateString();
         
         // Add smooth scrolling for better UX
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
-            anchor.addEventListener('click', function (e) {{
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', function (e) {
                 e.preventDefault();
-                document.querySelector(this.getAttribute('href')).scrollIntoView({{
+                document.querySelector(this.getAttribute('href')).scrollIntoView({
                     behavior: 'smooth'
-                }});
-            }});
-        }});
-        
-        // Add loading animation for images
-        document.querySelectorAll('img').forEach(img => {{
-            img.addEventListener('load', function() {{
-                this.style.opacity = '1';
-                this.style.transform = 'scale(1)';
-            }});
-            
-            img.style.opacity = '0';
-            img.style.transform = 'scale(0.95)';
-            img.style.transition = 'opacity 0.3s ease, transform 0.3s ease';
-        }});
+                });
+            });
+        });
     </script>
 </body>
-</html>'''
+</html>''')
+
+def generate_html_dashboard(df, metrics, charts):
+    """Generate an HTML dashboard with current metrics and charts (inline SVG keyed by chart name)."""
+    # Pull current metrics
+    total_apps = metrics['total_apps']
+    unique_companies = metrics['unique_companies']
+    interviews = metrics['interviews']
+    interview_rate = (interviews / total_apps * 100) if total_apps > 0 else 0
+    recruiters = metrics['recruiters']
+    avg_quality = metrics['avg_quality']
+    
+    closed_positions = metrics['closed_positions']
+    open_positions = metrics['open_positions']
+    unknown_positions = metrics['unknown_positions']
+    
+    closed_pct = (closed_positions / total_apps * 100) if total_apps > 0 else 0
+    open_pct = (open_positions / total_apps * 100) if total_apps > 0 else 0
+    unknown_pct = (unknown_positions / total_apps * 100) if total_apps > 0 else 0
+    
+    # Interview rates by quality and recruiter impact
+    interview_rates_by_quality = metrics['interview_rate_by_quality']
+    recruiter_interview_rate = metrics['recruiter_interview_rate']
+    no_recruiter_interview_rate = metrics['no_recruiter_interview_rate']
+    remote_positions = metrics['remote_positions']
+    local_positions = metrics['local_positions']
+    
+    # Key insight cards as (heading, paragraph) pairs
+    quality_text = " | ".join([f"<strong>Quality {q}:</strong> {r:.1f}% interview rate" for q, r in interview_rates_by_quality.items()])
+    insight_items = [
+        ('Interview Success by Quality', quality_text),
+        ('Recruiter Impact', f"Applications with recruiter involvement have a <strong>{recruiter_interview_rate:.1f}%</strong> interview rate compared to <strong>{no_recruiter_interview_rate:.1f}%</strong> without recruiters, highlighting the critical importance of networking and recruiter relationships."),
+        ('Position Closure Patterns', f"Position closure analysis shows {closed_positions} confirmed closed positions ({closed_pct:.1f}%) out of {total_apps} total applications. Most positions ({unknown_pct:.1f}%) still have unknown status, indicating potential for future developments."),
+        ('Geographic Distribution', f"<strong>Remote positions:</strong> {remote_positions} applications | <strong>Local positions:</strong> {local_positions} applications. Strategic focus on location preferences can optimize application success."),
+        ('Market Activity', f"With <strong>{unknown_pct:.1f}%</strong> of positions still having unknown status, there's significant potential for future developments. The data shows consistent application activity with strategic focus on higher-quality opportunities."),
+    ]
+    insights_html = "\n            \n".join(
+        f'''            <div class="insight-item">
+                <h4>{heading}</h4>
+                <p>{text}</p>
+            </div>''' for heading, text in insight_items
+    )
+    
+    # Fill in the dashboard page
+    html_content = DASHBOARD_TEMPLATE.substitute(
+        total_apps=total_apps,
+        unique_companies=unique_companies,
+        interviews=interviews,
+        interview_rate=f'{interview_rate:.1f}',
+        recruiters=recruiters,
+        avg_quality=f'{avg_quality:.2f}',
+        closed_positions=closed_positions,
+        open_positions=open_positions,
+        unknown_positions=unknown_positions,
+        closed_pct=f'{closed_pct:.1f}',
+        open_pct=f'{open_pct:.1f}',
+        unknown_pct=f'{unknown_pct:.1f}',
+        insights_html=insights_html,
+        **charts
+    )
     
     # Write the HTML file
     with open('job_search_dashboard.html', 'w', encoding='utf-8') as f:
@@ -799,27 +917,71 @@ def generate_html_dashboard(df):
     print("Dashboard saved as 'job_search_dashboard.html'")
     print("Open this file in your web browser to view the interactive dashboard.")
 
+# Dashboard charts by name; each plot function takes (df, metrics, fig), draws on the
+# cleared figure and returns inline SVG
+CHARTS = {
+    'applications_over_time': plot_applications_over_time,
+    'quality_distribution': plot_quality_distribution,
+    'interviews_per_month': plot_interviews_per_month,
+    'high_quality_interviews_per_month': plot_high_quality_interviews_per_month,
+    'high_quality_interview_table': plot_high_quality_interview_table,
+    'closed_positions_distribution': plot_closed_positions_distribution,
+}
+
+def render_chart(name, df, metrics, fig):
+    """Render one dashboard chart on the given figure under the dashboard plot style."""
+    with plt.style.context(PLOT_STYLE), sns.color_palette(PLOT_PALETTE):
+        return CHARTS[name](df, metrics, fig)
+
+# Figure owned by a chart worker process, created once by init_chart_worker()
+_worker_figure = None
+
+def init_chart_worker():
+    """Create the figure this worker process draws every chart it is given on."""
+    global _worker_figure
+    _worker_figure = plt.figure(layout='constrained')
+
+def render_chart_in_worker(name, df, metrics):
+    """Render one dashboard chart on the worker process's own figure."""
+    return render_chart(name, df, metrics, _worker_figure)
+
+def render_charts(df, metrics):
+    """Render every dashboard chart, in worker processes when PARALLEL_CHARTS is set."""
+    workers = min(len(CHARTS), os.cpu_count() or 1)
+    if PARALLEL_CHARTS and workers > 1:
+        # The charts share no state; each worker process reuses its own figure. Workers use
+        # the platform's default start method, since forking a process that has already
+        # loaded matplotlib is not safe everywhere (notably macOS).
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_chart_worker) as executor:
+            futures = {name: executor.submit(render_chart_in_worker, name, df, metrics) for name in CHARTS}
+            return {name: future.result() for name, future in futures.items()}
+    
+    # Draw every chart on one figure, closing it even if a chart fails to render
+    fig = plt.figure(layout='constrained')
+    try:
+        return {name: render_chart(name, df, metrics, fig) for name in CHARTS}
+    finally:
+        plt.close(fig)
+
 def main():
     # Load the data
-    df = load_data()
+    df = add_derived_columns(load_data())
+    
+    # Compute shared aggregates once
+    metrics = compute_all_metrics(df)
     
     # Generate and display metrics
-    generate_basic_metrics(df)
+    generate_basic_metrics(df, metrics)
     
     # Create visualizations
-    plot_applications_over_time(df)
-    plot_quality_distribution(df)
-    plot_interviews_per_month(df)
-    plot_high_quality_interviews_per_month(df)
-    plot_high_quality_interview_table(df)  # Added new visualization
-    plot_closed_positions_distribution(df)  # New visualization for closed positions
+    charts = render_charts(df, metrics)
     
     # Analyze interview success and position closure
-    analyze_interview_success(df)
-    analyze_closed_positions(df)
+    analyze_interview_success(df, metrics)
+    analyze_closed_positions(df, metrics)
     
     # Generate HTML dashboard
-    generate_html_dashboard(df)
+    generate_html_dashboard(df, metrics, charts)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file